@@ -1,13 +1,13 @@
 import ctypes
 from ctypes import wintypes
+import operator
 import os
 import pathlib
 import re
 import subprocess
-import tempfile
 import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import addonHandler
 import globalPluginHandler
@@ -22,18 +22,19 @@ addonHandler.initTranslation()
 
 
 _INT_RE = re.compile(r"-?\d+")
-_FLOAT_RE = re.compile(r"-?\d+(?:[.,]\d+)?")
 _PERCENT_RE = re.compile(r"(\d{1,3})\s*%")
 _SIZE_RE = re.compile(r"([0-9][0-9\s.,]*)\s*(B|KB|MB|GB|TB|PB)\b", re.IGNORECASE)
 _TEMP_RE = re.compile(r"(-?\d+)\s*C\b", re.IGNORECASE)
 _RPM_RE = re.compile(r"(\d+)\s*RPM", re.IGNORECASE)
-_DISK_LIST_ENTRY_RE = re.compile(r"^\s*\(\d{1,3}\)\s+.+?:\s+")
-_DISK_HEADER_RE = re.compile(r"^\s*\((\d{1,3})\)\s+(.+?)\s*$")
+_DISK_HEADER_MULTILINE_RE = re.compile(r"^[^\S\n]*\(\d{1,3}\)[^\S\n]+\S", re.MULTILINE)
+# Disk list entries such as "(1) Model : 500 GB" are not section headers.
+_SECTION_HEADER_RE = re.compile(r"^\s*\((\d{1,3})\)\s+(?!.*?:\s+\S)(.+?)\s*$")
 _KEY_VALUE_RE = re.compile(r"^\s*([A-Za-z][A-Za-z0-9 #/_().+-]{1,60})\s*:\s*(.+?)\s*$")
 
-_HEALTH_GOOD_KEYWORDS = ("good", "healthy", "ok")
-_HEALTH_WARN_KEYWORDS = ("caution", "warning", "degraded")
-_HEALTH_BAD_KEYWORDS = ("bad", "failed", "critical", "error")
+_HEALTH_GOOD_KEYWORDS = frozenset(("good", "healthy", "ok"))
+_HEALTH_WARN_KEYWORDS = frozenset(("caution", "warning", "degraded"))
+_HEALTH_BAD_KEYWORDS = frozenset(("bad", "failed", "critical", "error"))
+_HEALTH_TOKEN_RE = re.compile(r"[a-z]+")
 
 _SEE_MASK_NOCLOSEPROCESS = 0x00000040
 _SW_HIDE = 0
@@ -42,6 +43,21 @@ _WAIT_TIMEOUT = 0x00000102
 _ERROR_CANCELLED = 1223
 _CF_TEXT = 1
 _CF_UNICODETEXT = 13
+_FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+_FILE_NOTIFY_CHANGE_SIZE = 0x00000008
+_FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+_INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+_WAIT_FAILED = 0xFFFFFFFF
+_HWND_MESSAGE = wintypes.HWND(-3).value
+_WM_CLIPBOARDUPDATE = 0x031D
+_PM_REMOVE = 0x0001
+_QS_POSTMESSAGE = 0x0008
+_QS_ALLPOSTMESSAGE = 0x0100
+_OUTPUT_POLL_INTERVAL = 0.25
+
+# Removes every whitespace character _SIZE_RE's number group accepts
+# (digit-group separators such as "1 000,2 GB").
+_SIZE_WHITESPACE_RE = re.compile(r"\s+")
 
 _SIZE_MULTIPLIERS = {
     "B": 1,
@@ -73,6 +89,106 @@ class _SHELLEXECUTEINFOW(ctypes.Structure):
     ]
 
 
+_shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+_ShellExecuteExW = _shell32.ShellExecuteExW
+_ShellExecuteExW.argtypes = [ctypes.POINTER(_SHELLEXECUTEINFOW)]
+_ShellExecuteExW.restype = wintypes.BOOL
+
+_WaitForSingleObject = _kernel32.WaitForSingleObject
+_WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+_WaitForSingleObject.restype = wintypes.DWORD
+
+_GetExitCodeProcess = _kernel32.GetExitCodeProcess
+_GetExitCodeProcess.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+_GetExitCodeProcess.restype = wintypes.BOOL
+
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = [wintypes.HANDLE]
+_CloseHandle.restype = wintypes.BOOL
+
+_FindFirstChangeNotificationW = _kernel32.FindFirstChangeNotificationW
+_FindFirstChangeNotificationW.argtypes = [wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD]
+_FindFirstChangeNotificationW.restype = wintypes.HANDLE
+
+_FindNextChangeNotification = _kernel32.FindNextChangeNotification
+_FindNextChangeNotification.argtypes = [wintypes.HANDLE]
+_FindNextChangeNotification.restype = wintypes.BOOL
+
+_FindCloseChangeNotification = _kernel32.FindCloseChangeNotification
+_FindCloseChangeNotification.argtypes = [wintypes.HANDLE]
+_FindCloseChangeNotification.restype = wintypes.BOOL
+
+_GlobalLock = _kernel32.GlobalLock
+_GlobalLock.argtypes = [wintypes.HANDLE]
+_GlobalLock.restype = wintypes.LPVOID
+
+_GlobalUnlock = _kernel32.GlobalUnlock
+_GlobalUnlock.argtypes = [wintypes.HANDLE]
+_GlobalUnlock.restype = wintypes.BOOL
+
+_OpenClipboard = _user32.OpenClipboard
+_OpenClipboard.argtypes = [wintypes.HWND]
+_OpenClipboard.restype = wintypes.BOOL
+
+_CloseClipboard = _user32.CloseClipboard
+_CloseClipboard.argtypes = []
+_CloseClipboard.restype = wintypes.BOOL
+
+_IsClipboardFormatAvailable = _user32.IsClipboardFormatAvailable
+_IsClipboardFormatAvailable.argtypes = [wintypes.UINT]
+_IsClipboardFormatAvailable.restype = wintypes.BOOL
+
+_GetClipboardData = _user32.GetClipboardData
+_GetClipboardData.argtypes = [wintypes.UINT]
+_GetClipboardData.restype = wintypes.HANDLE
+
+_CreateWindowExW = _user32.CreateWindowExW
+_CreateWindowExW.argtypes = [
+    wintypes.DWORD,
+    wintypes.LPCWSTR,
+    wintypes.LPCWSTR,
+    wintypes.DWORD,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    wintypes.HWND,
+    wintypes.HMENU,
+    wintypes.HINSTANCE,
+    wintypes.LPVOID,
+]
+_CreateWindowExW.restype = wintypes.HWND
+
+_DestroyWindow = _user32.DestroyWindow
+_DestroyWindow.argtypes = [wintypes.HWND]
+_DestroyWindow.restype = wintypes.BOOL
+
+_AddClipboardFormatListener = _user32.AddClipboardFormatListener
+_AddClipboardFormatListener.argtypes = [wintypes.HWND]
+_AddClipboardFormatListener.restype = wintypes.BOOL
+
+_RemoveClipboardFormatListener = _user32.RemoveClipboardFormatListener
+_RemoveClipboardFormatListener.argtypes = [wintypes.HWND]
+_RemoveClipboardFormatListener.restype = wintypes.BOOL
+
+_PeekMessageW = _user32.PeekMessageW
+_PeekMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT, wintypes.UINT]
+_PeekMessageW.restype = wintypes.BOOL
+
+_MsgWaitForMultipleObjects = _user32.MsgWaitForMultipleObjects
+_MsgWaitForMultipleObjects.argtypes = [
+    wintypes.DWORD,
+    ctypes.POINTER(wintypes.HANDLE),
+    wintypes.BOOL,
+    wintypes.DWORD,
+    wintypes.DWORD,
+]
+_MsgWaitForMultipleObjects.restype = wintypes.DWORD
+
+
 def _to_int(value: Any) -> Optional[int]:
     if value is None:
         return None
@@ -97,23 +213,6 @@ def _to_int(value: Any) -> Optional[int]:
             return None
 
 
-def _to_float(value: Any) -> Optional[float]:
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    text = str(value).strip()
-    if not text:
-        return None
-    match = _FLOAT_RE.search(text)
-    if not match:
-        return None
-    try:
-        return float(match.group(0).replace(",", "."))
-    except ValueError:
-        return None
-
-
 def _clamp_percent(value: Optional[int]) -> Optional[int]:
     if value is None:
         return None
@@ -142,11 +241,9 @@ def _format_size(size_value: Any) -> str:
     if size <= 0:
         return "0 B"
     units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    value = float(size)
-    unit = 0
-    while value >= 1024 and unit < len(units) - 1:
-        value /= 1024.0
-        unit += 1
+    # Each binary unit step is 10 bits, so the unit index follows from the bit length.
+    unit = min((size.bit_length() - 1) // 10, len(units) - 1)
+    value = size / (1 << (unit * 10))
     return f"{value:.2f} {units[unit]}"
 
 
@@ -157,8 +254,12 @@ def _parse_size_bytes(text: Any) -> Optional[int]:
     match = _SIZE_RE.search(raw)
     if not match:
         return None
-    value = _to_float(match.group(1))
-    if value is None:
+    number_text = _SIZE_WHITESPACE_RE.sub("", match.group(1)).rstrip(".,")
+    if "." in number_text:
+        number_text = number_text.replace(",", "")
+    try:
+        value = float(number_text.replace(",", "."))
+    except ValueError:
         return None
     unit = match.group(2).upper()
     multiplier = _SIZE_MULTIPLIERS.get(unit)
@@ -180,6 +281,17 @@ def _parse_temperature(value: Any) -> Optional[int]:
     return None
 
 
+def _classify_health_text(text: str) -> Optional[int]:
+    tokens = set(_HEALTH_TOKEN_RE.findall(text.lower()))
+    if not _HEALTH_BAD_KEYWORDS.isdisjoint(tokens):
+        return 2
+    if not _HEALTH_WARN_KEYWORDS.isdisjoint(tokens):
+        return 1
+    if not _HEALTH_GOOD_KEYWORDS.isdisjoint(tokens):
+        return 0
+    return None
+
+
 def _parse_health_percent(status_text: str) -> Optional[int]:
     text = str(status_text or "").strip()
     if not text:
@@ -188,25 +300,22 @@ def _parse_health_percent(status_text: str) -> Optional[int]:
     if percent_match:
         return _clamp_percent(_to_int(percent_match.group(1)))
 
-    lowered = text.lower()
-    if any(keyword in lowered for keyword in _HEALTH_BAD_KEYWORDS):
+    health_code = _classify_health_text(text)
+    if health_code == 2:
         return 0
-    if any(keyword in lowered for keyword in _HEALTH_WARN_KEYWORDS):
+    if health_code == 1:
         return 50
-    if any(keyword in lowered for keyword in _HEALTH_GOOD_KEYWORDS):
+    if health_code == 0:
         return 100
     return None
 
 
 def _parse_health_code(status_text: str, health_percent: Optional[int]) -> Optional[int]:
-    lowered = str(status_text or "").strip().lower()
-    if lowered:
-        if any(keyword in lowered for keyword in _HEALTH_BAD_KEYWORDS):
-            return 2
-        if any(keyword in lowered for keyword in _HEALTH_WARN_KEYWORDS):
-            return 1
-        if any(keyword in lowered for keyword in _HEALTH_GOOD_KEYWORDS):
-            return 0
+    text = str(status_text or "").strip()
+    if text:
+        health_code = _classify_health_text(text)
+        if health_code is not None:
+            return health_code
     if health_percent is None:
         return None
     return 0 if health_percent >= 80 else 1
@@ -234,12 +343,16 @@ def _infer_media_type(interface_text: str, rotation_text: str, model_name: str)
 
 
 def _decode_text_bytes(data: bytes) -> str:
-    for encoding in ("utf-8-sig", "utf-16", "utf-16-le", "mbcs"):
-        try:
-            return data.decode(encoding)
-        except UnicodeDecodeError:
-            continue
-    return data.decode("utf-8", errors="replace")
+    if data[:3] == b"\xef\xbb\xbf":
+        return data.decode("utf-8-sig", errors="replace")
+    if data[:2] in (b"\xff\xfe", b"\xfe\xff"):
+        return data.decode("utf-16", errors="replace")
+    if data[1:2] == b"\x00":
+        return data.decode("utf-16-le", errors="replace")
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("mbcs", errors="replace")
 
 
 def _get_addon_root() -> pathlib.Path:
@@ -259,35 +372,22 @@ def _find_crystaldiskinfo_exe() -> Optional[pathlib.Path]:
     return None
 
 
-def _run_elevated_command(executable: str, parameters: str, timeout: int = 120) -> int:
-    shell32 = ctypes.WinDLL("shell32", use_last_error=True)
-    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
-
-    shell_execute_ex = shell32.ShellExecuteExW
-    shell_execute_ex.argtypes = [ctypes.POINTER(_SHELLEXECUTEINFOW)]
-    shell_execute_ex.restype = wintypes.BOOL
-
-    wait_for_single_object = kernel32.WaitForSingleObject
-    wait_for_single_object.argtypes = [wintypes.HANDLE, wintypes.DWORD]
-    wait_for_single_object.restype = wintypes.DWORD
-
-    get_exit_code_process = kernel32.GetExitCodeProcess
-    get_exit_code_process.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
-    get_exit_code_process.restype = wintypes.BOOL
-
-    close_handle = kernel32.CloseHandle
-    close_handle.argtypes = [wintypes.HANDLE]
-    close_handle.restype = wintypes.BOOL
-
+def _run_elevated_command(
+    executable: str,
+    parameters: str,
+    timeout: int = 120,
+    directory: Optional[str] = None,
+) -> int:
     info = _SHELLEXECUTEINFOW()
     info.cbSize = ctypes.sizeof(_SHELLEXECUTEINFOW)
     info.fMask = _SEE_MASK_NOCLOSEPROCESS
     info.lpVerb = "runas"
     info.lpFile = executable
     info.lpParameters = parameters
+    info.lpDirectory = directory
     info.nShow = _SW_HIDE
 
-    if not shell_execute_ex(ctypes.byref(info)):
+    if not _ShellExecuteExW(ctypes.byref(info)):
         error = ctypes.get_last_error()
         if error == _ERROR_CANCELLED:
             raise PermissionError("UAC prompt was cancelled.")
@@ -297,158 +397,80 @@ def _run_elevated_command(executable: str, parameters: str, timeout: int = 120)
         raise RuntimeError("ShellExecuteEx did not return process handle.")
 
     try:
-        wait_result = wait_for_single_object(info.hProcess, max(1, int(timeout * 1000)))
+        wait_result = _WaitForSingleObject(info.hProcess, max(1, int(timeout * 1000)))
         if wait_result == _WAIT_TIMEOUT:
             raise TimeoutError("Elevated command timed out.")
         if wait_result != _WAIT_OBJECT_0:
             raise RuntimeError(f"Unexpected wait result: {wait_result}.")
 
         exit_code = wintypes.DWORD()
-        if not get_exit_code_process(info.hProcess, ctypes.byref(exit_code)):
+        if not _GetExitCodeProcess(info.hProcess, ctypes.byref(exit_code)):
             raise RuntimeError("Unable to get exit code for elevated process.")
         return int(exit_code.value)
     finally:
-        close_handle(info.hProcess)
+        _CloseHandle(info.hProcess)
 
 
 def _run_elevated_background_task(executable: pathlib.Path, parameters: str, timeout: int = 120) -> int:
     task_name = f"DiscChecker_CDI_{os.getpid()}_{int(time.time() * 1000)}"
     task_command = subprocess.list2cmdline([str(executable)] + ([parameters] if parameters else []))
-    script_path = ""
-    try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="mbcs",
-            suffix=".cmd",
-            delete=False,
-        ) as temp_script:
-            temp_script.write("@echo off\r\n")
-            temp_script.write(f'set "DISC_CHECKER_TASK_COMMAND={task_command}"\r\n')
-            temp_script.write(
-                f'schtasks /Create /TN "{task_name}" /TR "%DISC_CHECKER_TASK_COMMAND%" /SC ONCE /ST 00:00 /RU SYSTEM /RL HIGHEST /F /Z >nul\r\n'
-            )
-            temp_script.write("if errorlevel 1 exit /b 11\r\n")
-            temp_script.write(f'schtasks /Run /TN "{task_name}" >nul\r\n')
-            temp_script.write("if errorlevel 1 exit /b 12\r\n")
-            temp_script.write("exit /b 0\r\n")
-            script_path = temp_script.name
-
-        params = f'/C "{script_path}"'
-        return _run_elevated_command("cmd.exe", params, timeout=timeout)
-    finally:
-        if script_path:
-            try:
-                os.unlink(script_path)
-            except OSError:
-                pass
-
-
-def _to_vbs_string_literal(text: str) -> str:
-    return '"' + text.replace('"', '""') + '"'
-
-
-def _run_elevated_hidden_vbs_command(executable: pathlib.Path, parameters: str, timeout: int = 120) -> int:
-    command_line = subprocess.list2cmdline([executable.name] + ([parameters] if parameters else []))
-    script_path = ""
-    try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-16",
-            suffix=".vbs",
-            delete=False,
-        ) as temp_script:
-            temp_script.write('Set sh = CreateObject("WScript.Shell")\r\n')
-            temp_script.write(f"sh.CurrentDirectory = {_to_vbs_string_literal(str(executable.parent))}\r\n")
-            temp_script.write(f"WScript.Quit sh.Run({_to_vbs_string_literal(command_line)}, 0, True)\r\n")
-            script_path = temp_script.name
-
-        vbs_params = f'//B //NoLogo "{script_path}"'
-        return _run_elevated_command("wscript.exe", vbs_params, timeout=timeout)
-    finally:
-        if script_path:
-            try:
-                os.unlink(script_path)
-            except OSError:
-                pass
+    create_command = subprocess.list2cmdline(
+        [
+            "schtasks", "/Create", "/TN", task_name, "/TR", task_command,
+            "/SC", "ONCE", "/ST", "00:00", "/RU", "SYSTEM", "/RL", "HIGHEST", "/F", "/Z",
+        ]
+    )
+    run_command = subprocess.list2cmdline(["schtasks", "/Run", "/TN", task_name])
+    # cmd strips the outer quotes of /C and runs the rest verbatim, so both
+    # schtasks calls share one elevation without a temporary script file.
+    params = f'/C "{create_command} >nul || exit /b 11 & {run_command} >nul || exit /b 12"'
+    return _run_elevated_command("cmd.exe", params, timeout=timeout)
 
 
 def _looks_like_crystaldiskinfo_report(text: str) -> bool:
-    raw = str(text or "").strip()
-    if not raw:
+    if not text or "CrystalDiskInfo" not in text:
         return False
-    if "CrystalDiskInfo" not in raw:
-        return False
-    for line in raw.splitlines():
-        if _DISK_HEADER_RE.match(line):
-            return True
-    return False
+    return _DISK_HEADER_MULTILINE_RE.search(text) is not None
 
 
 def _read_clipboard_text() -> Optional[str]:
-    user32 = ctypes.WinDLL("user32", use_last_error=True)
-    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
-
-    open_clipboard = user32.OpenClipboard
-    open_clipboard.argtypes = [wintypes.HWND]
-    open_clipboard.restype = wintypes.BOOL
-
-    close_clipboard = user32.CloseClipboard
-    close_clipboard.argtypes = []
-    close_clipboard.restype = wintypes.BOOL
-
-    is_clipboard_format_available = user32.IsClipboardFormatAvailable
-    is_clipboard_format_available.argtypes = [wintypes.UINT]
-    is_clipboard_format_available.restype = wintypes.BOOL
-
-    get_clipboard_data = user32.GetClipboardData
-    get_clipboard_data.argtypes = [wintypes.UINT]
-    get_clipboard_data.restype = wintypes.HANDLE
-
-    global_lock = kernel32.GlobalLock
-    global_lock.argtypes = [wintypes.HANDLE]
-    global_lock.restype = wintypes.LPVOID
-
-    global_unlock = kernel32.GlobalUnlock
-    global_unlock.argtypes = [wintypes.HANDLE]
-    global_unlock.restype = wintypes.BOOL
-
     for _ in range(20):
-        if open_clipboard(None):
+        if _OpenClipboard(None):
             break
         time.sleep(0.05)
     else:
         return None
 
     try:
-        if is_clipboard_format_available(_CF_UNICODETEXT):
-            handle = get_clipboard_data(_CF_UNICODETEXT)
+        if _IsClipboardFormatAvailable(_CF_UNICODETEXT):
+            handle = _GetClipboardData(_CF_UNICODETEXT)
             if not handle:
                 return None
-            pointer = global_lock(handle)
+            pointer = _GlobalLock(handle)
             if not pointer:
                 return None
             try:
                 text = ctypes.wstring_at(pointer)
             finally:
-                global_unlock(handle)
+                _GlobalUnlock(handle)
             text = str(text).strip()
             return text or None
 
-        if is_clipboard_format_available(_CF_TEXT):
-            handle = get_clipboard_data(_CF_TEXT)
+        if _IsClipboardFormatAvailable(_CF_TEXT):
+            handle = _GetClipboardData(_CF_TEXT)
             if not handle:
                 return None
-            pointer = global_lock(handle)
+            pointer = _GlobalLock(handle)
             if not pointer:
                 return None
             try:
                 text = ctypes.string_at(pointer).decode("mbcs", errors="replace")
             finally:
-                global_unlock(handle)
+                _GlobalUnlock(handle)
             text = str(text).strip()
             return text or None
     finally:
-        close_clipboard()
+        _CloseClipboard()
 
     return None
 
@@ -464,71 +486,191 @@ def _read_clipboard_text_if_ready(previous_text: str) -> Optional[str]:
     return None
 
 
-def _read_diskinfo_text_if_ready(output_path: pathlib.Path, previous_data: bytes) -> Optional[str]:
+def _get_file_snapshot(path: pathlib.Path) -> Optional[Tuple[int, int]]:
     try:
-        current_data = output_path.read_bytes()
+        stat_result = os.stat(path)
     except OSError:
         return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _read_diskinfo_text(output_path: pathlib.Path) -> Optional[str]:
+    # OSError is left to the caller, which retries reads that failed because
+    # the file was still held open.
+    current_data = output_path.read_bytes()
     if not current_data:
         return None
     decoded_text = _decode_text_bytes(current_data)
     if not _looks_like_crystaldiskinfo_report(decoded_text):
         return None
-    if not previous_data or current_data != previous_data:
-        return decoded_text
-    return None
+    return decoded_text
 
 
-def _read_crystaldiskinfo_output_if_ready(
-    output_path: pathlib.Path,
-    previous_data: bytes,
-    previous_clipboard_text: str,
-) -> Optional[str]:
-    diskinfo_text = _read_diskinfo_text_if_ready(output_path, previous_data)
-    if diskinfo_text is not None:
-        return diskinfo_text
-    return _read_clipboard_text_if_ready(previous_clipboard_text)
+def _open_change_notification(directory: pathlib.Path) -> Optional[int]:
+    handle = _FindFirstChangeNotificationW(
+        str(directory),
+        False,
+        _FILE_NOTIFY_CHANGE_FILE_NAME | _FILE_NOTIFY_CHANGE_SIZE | _FILE_NOTIFY_CHANGE_LAST_WRITE,
+    )
+    if not handle or handle == _INVALID_HANDLE_VALUE:
+        return None
+    return handle
+
+
+def _open_clipboard_listener() -> Optional[int]:
+    # A message-only window on the calling thread receives WM_CLIPBOARDUPDATE.
+    hwnd = _CreateWindowExW(0, "STATIC", None, 0, 0, 0, 0, 0, _HWND_MESSAGE, None, None, None)
+    if not hwnd:
+        return None
+    if not _AddClipboardFormatListener(hwnd):
+        _DestroyWindow(hwnd)
+        return None
+    return hwnd
+
+
+class _OutputWatcher:
+    # Waits for changes to DiskInfo.txt's directory and to the clipboard and
+    # reports (file_changed, clipboard_changed). A source that cannot be
+    # watched is polled every _OUTPUT_POLL_INTERVAL instead.
+
+    def __init__(self, directory: pathlib.Path) -> None:
+        self._change_handle = _open_change_notification(directory)
+        self._listener_hwnd = _open_clipboard_listener()
+
+    def close(self) -> None:
+        if self._change_handle is not None:
+            _FindCloseChangeNotification(self._change_handle)
+            self._change_handle = None
+        if self._listener_hwnd is not None:
+            _RemoveClipboardFormatListener(self._listener_hwnd)
+            _DestroyWindow(self._listener_hwnd)
+            self._listener_hwnd = None
+
+    def _drain_clipboard_updates(self) -> bool:
+        message = wintypes.MSG()
+        updated = False
+        while _PeekMessageW(
+            ctypes.byref(message),
+            self._listener_hwnd,
+            _WM_CLIPBOARDUPDATE,
+            _WM_CLIPBOARDUPDATE,
+            _PM_REMOVE,
+        ):
+            updated = True
+        return updated
+
+    def wait(self, seconds: float) -> Tuple[bool, bool]:
+        poll_file = self._change_handle is None
+        poll_clipboard = self._listener_hwnd is None
+        if poll_file or poll_clipboard:
+            seconds = min(seconds, _OUTPUT_POLL_INTERVAL)
+        timeout_ms = max(1, int(seconds * 1000))
+
+        if self._listener_hwnd is not None:
+            handle_count = 0 if poll_file else 1
+            handles = (wintypes.HANDLE * 1)(self._change_handle)
+            wait_result = _MsgWaitForMultipleObjects(
+                handle_count,
+                handles,
+                False,
+                timeout_ms,
+                _QS_POSTMESSAGE | _QS_ALLPOSTMESSAGE,
+            )
+            clipboard_changed = self._drain_clipboard_updates()
+        elif not poll_file:
+            wait_result = _WaitForSingleObject(self._change_handle, timeout_ms)
+            clipboard_changed = True
+        else:
+            time.sleep(seconds)
+            return True, True
+
+        if wait_result == _WAIT_FAILED:
+            self.close()
+            return True, True
+        file_changed = not poll_file and wait_result == _WAIT_OBJECT_0
+        if file_changed and not _FindNextChangeNotification(self._change_handle):
+            _FindCloseChangeNotification(self._change_handle)
+            self._change_handle = None
+        return file_changed or poll_file, clipboard_changed or poll_clipboard
 
 
 def _wait_for_crystaldiskinfo_output(
     output_path: pathlib.Path,
-    previous_data: bytes,
+    previous_snapshot: Optional[Tuple[int, int]],
     previous_clipboard_text: str,
     seconds: float,
 ) -> Optional[str]:
-    deadline = time.monotonic() + max(1.0, float(seconds))
-    while time.monotonic() < deadline:
-        text = _read_crystaldiskinfo_output_if_ready(output_path, previous_data, previous_clipboard_text)
-        if text is not None:
-            return text
-        time.sleep(0.25)
-    return _read_crystaldiskinfo_output_if_ready(output_path, previous_data, previous_clipboard_text)
+    # With seconds=0 the file and clipboard are checked once, without waiting.
+    deadline = time.monotonic() + max(0.0, float(seconds))
+    # DiskInfo.txt is only read when its mtime/size differs from the last
+    # snapshot that was read (or from the stale file left by a previous run).
+    seen_snapshot = previous_snapshot
+    watcher = _OutputWatcher(output_path.parent)
+    try:
+        file_changed = True
+        clipboard_changed = True
+        read_pending = False
+        while True:
+            if file_changed or read_pending:
+                read_pending = False
+                snapshot = _get_file_snapshot(output_path)
+                if snapshot is not None and snapshot[1] > 0 and snapshot != seen_snapshot:
+                    try:
+                        text = _read_diskinfo_text(output_path)
+                    except OSError:
+                        # CDI or a scanner still holds the file. Closing it may not
+                        # change its stat or signal the watcher, so poll again.
+                        read_pending = True
+                    else:
+                        seen_snapshot = snapshot
+                        if text is not None:
+                            return text
+            if clipboard_changed:
+                text = _read_clipboard_text_if_ready(previous_clipboard_text)
+                if text is not None:
+                    return text
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            if read_pending:
+                remaining = min(remaining, _OUTPUT_POLL_INTERVAL)
+            file_changed, clipboard_changed = watcher.wait(remaining)
+    finally:
+        watcher.close()
 
 
 def _run_crystaldiskinfo_dump(executable: pathlib.Path, timeout: int = 180) -> str:
     output_path = executable.parent / "DiskInfo.txt"
-    previous_data = b""
-    if output_path.is_file():
-        try:
-            previous_data = output_path.read_bytes()
-        except OSError:
-            previous_data = b""
+    previous_snapshot = _get_file_snapshot(output_path)
+    if previous_snapshot is not None:
         try:
             output_path.unlink()
-            previous_data = b""
+            previous_snapshot = None
         except OSError:
             pass
 
     previous_clipboard_text = _read_clipboard_text() or ""
 
     launch_issues: List[str] = []
+    # Run CDI elevated as the user first so /CopyExit reaches the user's
+    # clipboard. The SYSTEM scheduled task runs in session 0 and can only
+    # deliver DiskInfo.txt, so it is the last-resort fallback.
     launch_methods = [
-        ("vbs-hidden", lambda: _run_elevated_hidden_vbs_command(executable, "/CopyExit", timeout=timeout)),
+        (
+            "direct-elevated",
+            lambda: _run_elevated_command(
+                str(executable),
+                "/CopyExit",
+                timeout=timeout,
+                directory=str(executable.parent),
+            ),
+        ),
         ("scheduled-task-hidden", lambda: _run_elevated_background_task(executable, "/CopyExit", timeout=timeout)),
-        ("direct-elevated", lambda: _run_elevated_command(str(executable), "/CopyExit", timeout=timeout)),
     ]
 
-    for method_name, method_runner in launch_methods:
+    for index, (method_name, method_runner) in enumerate(launch_methods):
+        is_last_method = index == len(launch_methods) - 1
         try:
             exit_code = method_runner()
         except PermissionError:
@@ -537,13 +679,17 @@ def _run_crystaldiskinfo_dump(executable: pathlib.Path, timeout: int = 180) -> s
             launch_issues.append(f"{method_name}: launch failed ({exc})")
             continue
 
+        wait_time = 25.0 if is_last_method else 10.0
         if exit_code != 0:
             launch_issues.append(f"{method_name}: exit code {exit_code}")
+            if not is_last_method:
+                # CrystalDiskInfo may still have written its report before exiting
+                # non-zero, so check for output once but do not wait for more.
+                wait_time = 0.0
 
-        wait_time = 10.0 if method_name != "direct-elevated" else 25.0
         output_text = _wait_for_crystaldiskinfo_output(
             output_path=output_path,
-            previous_data=previous_data,
+            previous_snapshot=previous_snapshot,
             previous_clipboard_text=previous_clipboard_text,
             seconds=wait_time,
         )
@@ -579,68 +725,78 @@ def _split_disk_sections(text: str) -> List[Dict[str, Any]]:
     sections: List[Dict[str, Any]] = []
     current: Optional[Dict[str, Any]] = None
 
-    for raw_line in text.splitlines():
-        line = raw_line.rstrip()
-        if _DISK_LIST_ENTRY_RE.match(line):
+    for line in text.splitlines():
+        # Most lines are S.M.A.R.T. table rows or separators; only run a regex
+        # when the first character can start a header or a property.
+        stripped = line.lstrip()
+        if not stripped:
             continue
-
-        header_match = _DISK_HEADER_RE.match(line)
-        if header_match:
-            if current is not None:
-                sections.append(current)
-            current = {
-                "Number": _to_int(header_match.group(1)),
-                "HeaderName": header_match.group(2).strip(),
-                "Lines": [],
-            }
+        first_char = stripped[0]
+        if first_char == "(":
+            header_match = _SECTION_HEADER_RE.match(stripped)
+            if header_match:
+                if current is not None:
+                    sections.append(current)
+                current = {
+                    "Number": _to_int(header_match.group(1)),
+                    "HeaderName": header_match.group(2).strip(),
+                    "Lines": [],
+                }
             continue
 
-        if current is not None:
-            current["Lines"].append(line)
+        if current is not None and first_char.isalpha() and ":" in stripped:
+            current["Lines"].append(stripped)
 
     if current is not None:
         sections.append(current)
     return sections
 
 
+# (property key, entry field, converter, value when the property is missing)
+_ENTRY_FIELD_MAP: Tuple[Tuple[str, str, Callable[[str], Any], Any], ...] = (
+    ("serial number", "SerialNumber", str, ""),
+    ("disk size", "Size", _parse_size_bytes, None),
+    ("temperature", "Temperature", _parse_temperature, None),
+    ("power on hours", "PowerOnHours", _to_int, None),
+)
+
+
 def _build_entry_from_section(section: Dict[str, Any]) -> Dict[str, Any]:
     properties, ordered_properties = _parse_section_properties(section.get("Lines") or [])
 
-    model_name = _first_non_empty(properties.get("model"), section.get("HeaderName"))
-    serial_number = _first_non_empty(properties.get("serial number"))
-    size_bytes = _parse_size_bytes(properties.get("disk size"))
-    interface = _first_non_empty(properties.get("interface"))
-    rotation = _first_non_empty(properties.get("rotation rate"))
+    # Property values are already stripped and never empty.
+    model_name = properties.get("model") or _first_non_empty(section.get("HeaderName"))
+    interface = properties.get("interface", "")
+    rotation = properties.get("rotation rate", "")
 
-    health_status_raw = _first_non_empty(properties.get("health status"), "Unknown")
-    health_percent = _parse_health_percent(health_status_raw)
-    health_code = _parse_health_code(health_status_raw, health_percent)
-    temperature = _parse_temperature(properties.get("temperature"))
-    power_on_hours = _to_int(properties.get("power on hours"))
+    health_status = properties.get("health status", "Unknown")
+    health_percent = _parse_health_percent(health_status)
+    health_code = _parse_health_code(health_status, health_percent)
 
-    media_type = _infer_media_type(interface, rotation, model_name)
     wear: Optional[int] = None
     if isinstance(health_percent, int):
         wear = max(0, min(100, 100 - health_percent))
 
-    health_status = health_status_raw
-
-    return {
+    entry: Dict[str, Any] = {
         "Number": section.get("Number"),
         "FriendlyName": model_name,
-        "SerialNumber": serial_number,
-        "Size": size_bytes,
-        "BusType": interface if interface else "no data",
-        "MediaType": media_type,
-        "HealthStatus": health_status,
-        "HealthPercent": health_percent,
-        "Temperature": temperature,
-        "Wear": wear,
-        "PowerOnHours": power_on_hours,
-        "CdiProperties": ordered_properties,
-        "_healthCode": health_code,
-        "_source": "crystaldiskinfo",
     }
+    for key, field, converter, default in _ENTRY_FIELD_MAP:
+        value = properties.get(key)
+        entry[field] = converter(value) if value is not None else default
+    entry.update(
+        {
+            "BusType": interface if interface else "no data",
+            "MediaType": _infer_media_type(interface, rotation, model_name),
+            "HealthStatus": health_status,
+            "HealthPercent": health_percent,
+            "Wear": wear,
+            "CdiProperties": ordered_properties,
+            "_healthCode": health_code,
+            "_source": "crystaldiskinfo",
+        }
+    )
+    return entry
 
 
 def _parse_crystaldiskinfo_entries(text: str) -> List[Dict[str, Any]]:
@@ -698,9 +854,19 @@ def _build_report(entries: List[Dict[str, Any]]) -> Dict[str, str]:
             "details": "Windows did not return any physical disks.",
         }
 
+    numbered: List[Dict[str, Any]] = []
+    unnumbered: List[Dict[str, Any]] = []
+    for entry in entries:
+        if isinstance(entry.get("Number"), int):
+            numbered.append(entry)
+        else:
+            unnumbered.append(entry)
+    numbered.sort(key=operator.itemgetter("Number"))
+
     warnings = 0
-    lines = []
-    for entry in sorted(entries, key=lambda item: (item.get("Number") is None, item.get("Number"))):
+    # One flat list of report lines; a blank line separates disks.
+    lines: List[str] = []
+    for entry in numbered + unnumbered:
         alert = _is_bad_health(entry)
         if alert:
             warnings += 1
@@ -717,11 +883,15 @@ def _build_report(entries: List[Dict[str, Any]]) -> Dict[str, str]:
         cdi_properties = entry.get("CdiProperties")
 
         state_label = "ALERT" if alert else "OK"
-        parts = [
-            f"[{state_label}] Disk {number}: {name}",
-            f"  Health: {health_percent_text}",
-            f"  Temperature: {temperature_text}",
-        ]
+        if lines:
+            lines.append("")
+        lines.extend(
+            (
+                f"[{state_label}] Disk {number}: {name}",
+                f"  Health: {health_percent_text}",
+                f"  Temperature: {temperature_text}",
+            )
+        )
         if isinstance(cdi_properties, list):
             for item in cdi_properties:
                 if not isinstance(item, tuple) or len(item) != 2:
@@ -730,12 +900,11 @@ def _build_report(entries: List[Dict[str, Any]]) -> Dict[str, str]:
                 value = str(item[1]).strip()
                 if not key or not value:
                     continue
-                parts.append(f"  {key}: {value}")
-        lines.append("\n".join(parts))
+                lines.append(f"  {key}: {value}")
 
     healthy = len(entries) - warnings
     summary = f"Disks: {len(entries)}. Healthy: {healthy}. Alerts: {warnings}."
-    details = "\n\n".join(lines)
+    details = "\n".join(lines)
     return {
         "summary": summary,
         "details": details,
@@ -790,6 +959,10 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
         threading.Thread(target=self._worker, daemon=True).start()
 
     def _worker(self) -> None:
+        # Runs on its own daemon thread, so the elevation wait and report
+        # parsing never block NVDA's GUI thread. Parsing stays in-process:
+        # a process pool would spawn nvda.exe itself, and a further thread
+        # gains nothing for pure-Python parsing that holds the GIL anyway.
         try:
             entries = _collect_disk_entries()
             report = _build_report(entries)
@@ -4,6 +4,9 @@ import argparse
 import pathlib
 import zipfile
 
+# Already-compressed formats gain nothing from deflate; store them as-is.
+_STORED_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".zip", ".7z"}
+
 
 def _should_include_file(addon_dir: pathlib.Path, file_path: pathlib.Path) -> bool:
 	rel_path = file_path.relative_to(addon_dir).as_posix()
@@ -44,14 +47,15 @@ def build(addon_dir: pathlib.Path, output_dir: pathlib.Path) -> pathlib.Path:
 	output_dir.mkdir(parents=True, exist_ok=True)
 	addon_path = output_dir / f"{name}-{version}.nvda-addon"
 
-	with zipfile.ZipFile(addon_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+	with zipfile.ZipFile(addon_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
 		for file_path in sorted(addon_dir.rglob("*")):
 			if not file_path.is_file():
 				continue
 			if not _should_include_file(addon_dir, file_path):
 				continue
 			rel_path = file_path.relative_to(addon_dir).as_posix()
-			archive.write(file_path, rel_path)
+			compress_type = zipfile.ZIP_STORED if file_path.suffix.lower() in _STORED_SUFFIXES else None
+			archive.write(file_path, rel_path, compress_type=compress_type)
 
 	return addon_path
 